@@ -1,10 +1,13 @@
 import re
+import io
 import json
 import sys
 import subprocess
 import requests
 import os
 import time
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from ctypes import *
 import git
@@ -12,8 +15,27 @@ import numpy as np
 from PyQt5 import QtWidgets
 from PyQt5.QtWidgets import QMessageBox
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 REPO_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Startup update checks are skipped if the repository fetched from its remote within this many seconds
+UPDATE_CHECK_TTL = 60
+
+# Directory listings keyed by path: {path: (directory mtime, sorted filenames)}
+_dir_cache = {}
+
+# Parsed reports keyed by path: {path: ((file mtime_ns, file size), data)}, least recently used first
+REPORT_CACHE_SIZE = 512
+_report_cache = OrderedDict()
+_report_cache_lock = threading.Lock()  # Reports may be read from several threads at once
+
+# The first overall_status in a report belongs to test_reports[0], which is written near the top of the file
+_STATUS_RE = re.compile(rb'"overall_status"\s*:\s*"([^"]*)"')
+
 def ensure_numpy():
     """Ensure numpy is installed."""
     try:
@@ -53,31 +75,26 @@ def check_gitpython():
         return check_gitpython()  # Retry import after installation
 
 def check_for_updates(directory):
-    """Checks for updates in the specified Git repository directory and pulls if updates are available."""
+    """Pulls any updates for the specified Git repository directory with a single fast-forward pull."""
+    # Git rewrites FETCH_HEAD on every fetch or pull, so its mtime is the time of the last contact with the remote
     try:
-        # Change to the script directory
-        os.chdir(directory)
-
-        # Run git fetch to check for updates
-        fetch_result = subprocess.run(['git', 'fetch'], capture_output=True, text=True)
-
-        if fetch_result.returncode != 0:
-            print("Error fetching updates:", fetch_result.stderr)
+        age = time.time() - os.path.getmtime(os.path.join(directory, '.git', 'FETCH_HEAD'))
+        if age < UPDATE_CHECK_TTL:
+            print(f"Skipping update check; last fetched {int(age)} seconds ago.")
             return
+    except OSError:
+        pass  # Never fetched, or not a plain repository; check now
 
-        # Check the status to see if we are behind
-        status_result = subprocess.run(['git', 'status', '-uno'], capture_output=True, text=True)
-
-        if 'Your branch is behind' in status_result.stdout:
-            print("Updates available. Pulling the latest changes...")
-            pull_result = subprocess.run(['git', 'pull'], capture_output=True, text=True)
+    try:
+        # One pull fetches and merges in a single git process and network round trip (cwd= leaves the process's working directory alone)
+        pull_result = subprocess.run(['git', 'pull', '--ff-only'], cwd=directory, capture_output=True, text=True)
 
-            if pull_result.returncode == 0:
-                print("Successfully pulled updates:", pull_result.stdout)
-            else:
-                print("Error pulling updates:", pull_result.stderr)
-        else:
+        if pull_result.returncode != 0:
+            print("Error pulling updates:", pull_result.stderr)
+        elif pull_result.stdout.startswith('Already up'):
             print("No updates available.")
+        else:
+            print("Successfully pulled updates:", pull_result.stdout)
 
     except Exception as e:
         print(f"An error occurred: {e}")
@@ -96,6 +113,70 @@ def push_to_github(directory, commit_message):
     except Exception as e:
         print(f"Unexpected error: {e}")
 
+def load_json_file(path):
+    """Loads a JSON file, using orjson when it is installed and the standard json module otherwise."""
+    with open(path, 'rb') as file:
+        data = file.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def write_json_file(path, data):
+    """Writes data as indented JSON in a single write to a temporary file, then atomically replaces the target file."""
+    payload = json.dumps(data, indent=4)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', buffering=max(len(payload), io.DEFAULT_BUFFER_SIZE)) as file:
+        file.write(payload)
+        # Make sure the data is on disk before it replaces the old file
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+def load_report_cached(path):
+    """Loads a report JSON file, reusing the parsed data while the file's mtime and size are unchanged.
+
+    The returned data is shared with the cache and must not be modified.
+    """
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _report_cache_lock:
+        entry = _report_cache.get(path)
+        if entry and entry[0] == key:
+            _report_cache.move_to_end(path)
+            return entry[1]
+
+    data = load_json_file(path)
+    with _report_cache_lock:
+        _report_cache[path] = (key, data)
+        _report_cache.move_to_end(path)
+        if len(_report_cache) > REPORT_CACHE_SIZE:
+            _report_cache.popitem(last=False)
+    return data
+
+def invalidate_report_cache(path):
+    """Drops a report from the parsed report cache after it has been rewritten."""
+    with _report_cache_lock:
+        _report_cache.pop(path, None)
+
+def read_overall_status(path):
+    """Returns the overall status of a report's first test report, reading only the start of the file when possible."""
+    with open(path, 'rb') as file:
+        head = file.read(4096)
+    match = _STATUS_RE.search(head)
+    if match:
+        return match.group(1).decode()
+
+    # Fall back to a full parse for reports that do not have the field near the top
+    report_content = load_report_cached(path)
+    return (report_content.get("test_reports") or [{}])[0].get("overall_status", "Unknown")
+
+def cached_listdir(path):
+    """Returns the sorted filenames in a directory, re-listing it only when the directory's mtime changes."""
+    mtime = os.stat(path).st_mtime
+    cached_mtime, filenames = _dir_cache.get(path, (-1, None))
+    if cached_mtime != mtime:
+        filenames = sorted(os.listdir(path))
+        _dir_cache[path] = (mtime, filenames)
+    return filenames
+
 def calculate_average(samples):
     """Calculates and returns the truncated average of the sample readings."""
     average = np.mean(samples)
@@ -280,8 +361,8 @@ def messages_to_html(messages):
     if not messages:
         return "<p>No messages available.</p>"
 
-    # Start building the HTML table
-    html = """
+    # Collect the HTML table parts and join them once at the end
+    parts = ["""
     <h3>Messages</h3>
     <table border="1" style="width: 100%; border-collapse: collapse;">
         <tr>
@@ -289,30 +370,29 @@ def messages_to_html(messages):
             <th style="padding: 10px;">Source</th>
             <th style="padding: 10px;">Message</th>
         </tr>
-    """
+    """]
 
     for message in messages:
         timestamp = message.get("timestamp", "N/A")
         source = message.get("source", "Unknown")
         red_tag_message = message.get("red_tag_message", "No message available")
 
-        html += f"""
+        parts.append(f"""
         <tr>
             <td style="padding: 10px;">{timestamp}</td>
             <td style="padding: 10px;">{source}</td>
             <td style="padding: 10px;">{red_tag_message}</td>
         </tr>
-        """
+        """)
 
-    html += "</table>"
-    return html
+    parts.append("</table>")
+    return "".join(parts)
 
-def add_red_tag_message(message, filename):
-    """Adds a red tag message to the JSON file specified by the filename."""
+def add_red_tag_message(message, filename, push=True):
+    """Adds a red tag message to the JSON file specified by the filename; pass push=False to leave pushing to the caller."""
     
     # Load existing data
-    with open(filename, 'r') as file:
-        data = json.load(file)
+    data = load_json_file(filename)
     
     # Generate timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -332,14 +412,14 @@ def add_red_tag_message(message, filename):
         json.dump(data, file, indent=4)
     
     # Push to GitHub
-    push_to_github(REPO_DIR, "Added red tag message")
+    if push:
+        push_to_github(REPO_DIR, "Added red tag message")
 
 def load_red_tag_messages(self):
     """Reloads and displays the red tag messages from the last opened file."""
     if hasattr(self, 'last_opened_file'):
         try:
-            with open(self.last_opened_file, 'r') as file:
-                report_content = json.load(file)
+            report_content = load_json_file(self.last_opened_file)
             self.red_tag_display.setHtml(red_tag_messages_json_to_html(report_content))
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load red tag messages: {str(e)}")
@@ -353,8 +433,7 @@ def save_red_tag_messages(self, messages):
 def update_red_tag_message(file_path, row, new_message):
     """Update the red tag message in the JSON file."""
     # Load the existing JSON data
-    with open(file_path, 'r') as file:
-        report_content = json.load(file)
+    report_content = load_json_file(file_path)
 
     # Update the red tag message at the specified row
     if row < len(report_content["red_tag_messages"]):
@@ -367,8 +446,7 @@ def update_red_tag_message(file_path, row, new_message):
 def update_red_tag_message(old_message, new_message, report_file):
     """Update a red tag message in the report JSON file."""
     try:
-        with open(report_file, 'r') as file:
-            data = json.load(file)
+        data = load_json_file(report_file)
 
         # Update the red tag messages list
         if "red_tag_messages" in data:
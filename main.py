@@ -2,10 +2,14 @@ import os
 import sys
 import subprocess
 from datetime import datetime
-import json
 import shutil
+import locale
+import heapq
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from common import (parse_pcb_barcode, push_to_github, report_json_to_html, red_tag_messages_json_to_html, process_flow_json_to_html, report_json_to_md,
-                    load_red_tag_messages, add_red_tag_message, save_red_tag_messages, check_for_updates, messages_to_html, send_report_via_slack)
+                    load_red_tag_messages, add_red_tag_message, save_red_tag_messages, check_for_updates, messages_to_html, send_report_via_slack,
+                    load_json_file, write_json_file, load_report_cached, invalidate_report_cache, read_overall_status, cached_listdir)
 
 def ensure_pyqt_installed():
     """Ensure PyQt5 is installed."""
@@ -18,58 +22,111 @@ def ensure_pyqt_installed():
 
 try:
     from PyQt5.QtWidgets import (
-        QMainWindow, QMenuBar, QMenu, QAction, QWidget, QVBoxLayout, QTabWidget, QListWidget, QTextEdit, 
+        QMainWindow, QMenuBar, QMenu, QAction, QWidget, QVBoxLayout, QTabWidget, QListWidget, QTextEdit, QPlainTextEdit,
         QPushButton, QApplication, QLabel, QMessageBox, QHBoxLayout, QLineEdit, 
-        QListWidgetItem, QDialog, QInputDialog, QSizePolicy, QFileDialog, QComboBox, QRadioButton
+        QListWidgetItem, QDialog, QInputDialog, QSizePolicy, QFileDialog, QComboBox
     )
-    from PyQt5.QtCore import QThread, pyqtSignal, Qt
+    from PyQt5.QtCore import QProcess, QThread, QTimer, QFileSystemWatcher, Qt
     from PyQt5.QtGui import QPixmap, QBrush, QColor
 except ImportError:
     print("PyQt5 is not installed. Installing now...")
     ensure_pyqt_installed()
 
-class TestRunner(QThread):
-    output_signal = pyqtSignal(str)
-    error_signal = pyqtSignal(str)
+# Number of rendered reports kept in memory for quick re-display
+HTML_CACHE_SIZE = 32
 
-    def __init__(self, script, directory):
+# Memory, in bytes, that decoded report images may use while kept for quick re-display
+PIXMAP_CACHE_BYTES = 256 * 1024 * 1024
+
+# (background, foreground) brushes for report list items by lowercase overall status, shared by every item
+STATUS_BRUSHES = {
+    "pass": (QBrush(QColor("darkgreen")), QBrush(QColor("white"))),
+    "fail": (QBrush(QColor("red")), QBrush(QColor("white"))),
+}
+UNKNOWN_STATUS_BRUSHES = (QBrush(QColor("lightgray")), QBrush(QColor("black")))
+
+# Threads used to read report statuses when several reports need reading at once
+STATUS_READ_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+# Delay before pushing to GitHub, so changes made in quick succession go out in one commit
+PUSH_DELAY_MS = 5000
+
+# Lines kept in the Testing tab output pane
+OUTPUT_MAX_LINES = 5000
+
+# Helper modules in test_programs that are not runnable tests
+EXCLUDED_TEST_PROGRAMS = frozenset({'dwfconstants.py', 'Enumerate.py'})
+
+# Directory holding this script (the testing_hub repository) and its test programs, resolved once at import
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEST_PROGRAMS_DIR = os.path.join(MODULE_DIR, 'test_programs')
+
+# Process messages are stored next to this script, whatever the working directory is
+APPLY_MESSAGES_PATH = os.path.join(MODULE_DIR, 'apply_messages.json')
+
+def red_tag_sort_key(message):
+    """Case-insensitive sort key for red tag messages."""
+    return message.get("red_tag_message", "").lower()
+
+class UpdateCheckWorker(QThread):
+    def __init__(self, directory):
         super().__init__()
-        self.script = script
         self.directory = directory
-        self.process = None
 
     def run(self):
-        os.chdir(self.directory)
-        command = f'python -u "{self.script}"' if sys.platform.startswith('win') else f'python3 -u "{self.script}"'
-
-        self.process = subprocess.Popen(
-            command, 
-            shell=True, 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE, 
-            text=True
-        )
-
-        # Read output
-        for stdout_line in iter(self.process.stdout.readline, ""):
-            if stdout_line:
-                self.output_signal.emit(stdout_line.strip())
-        self.process.stdout.close()
+        check_for_updates(self.directory)
 
-        # Read errors
-        for stderr_line in iter(self.process.stderr.readline, ""):
-            if stderr_line:
-                self.error_signal.emit(stderr_line.strip())
-        self.process.stderr.close()
+class PushWorker(QThread):
+    def __init__(self, directory, commit_message):
+        super().__init__()
+        self.directory = directory
+        self.commit_message = commit_message
 
-        self.process.wait()
+    def run(self):
+        push_to_github(self.directory, self.commit_message)
 
 class TestLauncher(QMainWindow):
     def __init__(self, parent_dir):
         super().__init__()
         self.parent_dir = parent_dir
-        self.runner = None
+        self._reports_dir = os.path.join(parent_dir, 'testing_hub', 'reports')
+        self._images_dir = os.path.join(parent_dir, 'testing_hub', 'images')
+        self._test_programs_dir = TEST_PROGRAMS_DIR
+        # Report statuses saved between runs; kept outside reports/ so writing it does not wake the reports watcher
+        self._report_index_path = os.path.join(parent_dir, 'testing_hub', '.report_index.json')
+        # Git pulls also run in a QProcess so their output can be shown as it arrives
+        self.git_process = QProcess(self)
+        self.git_process.setProcessChannelMode(QProcess.MergedChannels)
+        self.git_process.readyReadStandardOutput.connect(self._read_git_output)
+        self.git_process.finished.connect(self.on_git_pull_finished)
+        self.git_process.errorOccurred.connect(self._on_git_error)
+        self._update_worker = None  # Startup update check, run in the background
+        self._push_worker = None
+        self._pending_push_messages = []  # Commit messages for changes waiting to be pushed
+
+        # Pushes wait briefly so changes made in quick succession share one commit and push
+        self._push_timer = QTimer(self)
+        self._push_timer.setSingleShot(True)
+        self._push_timer.setInterval(PUSH_DELAY_MS)
+        self._push_timer.timeout.connect(self._start_push)
+
+        # Tests run one at a time in a QProcess whose output arrives through the event loop
+        self.runner = QProcess(self)
+        self.runner.readyReadStandardOutput.connect(lambda: self._read_test_output(QProcess.StandardOutput))
+        self.runner.readyReadStandardError.connect(lambda: self._read_test_output(QProcess.StandardError))
+        self.runner.finished.connect(self._flush_test_output)
+        self.runner.errorOccurred.connect(self._on_test_error)
         self.script_mapping = {}
+        self._process_message_dialog = None
+        self._report_cache = {}  # {report filename: {"status": overall status, "mtime": file mtime_ns}}
+        self._lowercase_names = []  # [(lowercase filename, filename)], sorted
+        self._html_cache = OrderedDict()  # {report path: ((file mtime_ns, file size), rendered HTML tuple)}, most recent last
+        self._displayed_render = None  # Rendered HTML tuple currently shown in the report displays
+        self._pixmap_cache = OrderedDict()  # {image path: decoded QPixmap}, most recent last
+        self._pixmap_cache_bytes = 0  # Memory used by the pixmaps in _pixmap_cache
+        self._board_index = defaultdict(list)  # {board name: [report paths]}
+        self._boards_mtime = None  # Reports directory mtime when the board index was last built
+        self._sorted_messages = {}  # {report path: ((file mtime_ns, file size), its red tag messages sorted by text)}
         self.initUI()
 
     def initUI(self):
@@ -87,9 +144,9 @@ class TestLauncher(QMainWindow):
         self.setup_testing_tab()
         self.tab_widget.addTab(self.testing_tab, "Testing")
 
-        # Create Reports tab
+        # Create Reports tab (its contents are built the first time it is shown)
         self.reports_tab = QWidget()
-        self.setup_reports_tab()
+        self._reports_tab_built = False
         self.tab_widget.addTab(self.reports_tab, "Reports")
 
         # Create Message Reader tab
@@ -97,6 +154,9 @@ class TestLauncher(QMainWindow):
         self.setup_message_reader_tab()
         self.tab_widget.addTab(self.message_reader_tab, "Message Reader")
 
+        self.tab_widget.currentChanged.connect(self._maybe_build_reports_tab)
+        self.tab_widget.currentChanged.connect(self._maybe_refresh_boards)
+
         # Set the main layout inside a central widget
         central_widget = QWidget(self)
         layout = QVBoxLayout(central_widget)
@@ -131,6 +191,61 @@ class TestLauncher(QMainWindow):
         """Closes the application."""
         self.close()
 
+    def closeEvent(self, event):
+        """Finish any background git work and send any scheduled push before closing, so no change is left uncommitted."""
+        self._push_timer.stop()
+        if self._update_worker:
+            self._update_worker.wait()
+        if self.git_process.state() != QProcess.NotRunning:
+            self.git_process.waitForFinished(-1)
+        if self._push_worker:
+            self._push_worker.wait()
+        if self._pending_push_messages:
+            push_to_github(MODULE_DIR, self._take_push_message())
+        super().closeEvent(event)
+
+    def start_update_check(self, directory):
+        """Check for updates on a background thread so the window does not wait on the network."""
+        self._update_worker = UpdateCheckWorker(directory)
+        # A push scheduled while the check ran starts once it is done
+        self._update_worker.finished.connect(self._on_git_finished)
+        self._update_worker.start()
+
+    def _git_busy(self):
+        """Return True while any git command started by the app is running; they share the repository index and run one at a time."""
+        return ((self._update_worker is not None and self._update_worker.isRunning())
+                or self.git_process.state() != QProcess.NotRunning
+                or (self._push_worker is not None and self._push_worker.isRunning()))
+
+    def push_in_background(self, commit_message):
+        """Schedule a commit and push of all changes on a background thread.
+
+        Requests made within PUSH_DELAY_MS of each other, or while a push is running, go out together in one commit.
+        """
+        if commit_message not in self._pending_push_messages:
+            self._pending_push_messages.append(commit_message)
+        self._push_timer.start()
+
+    def _take_push_message(self):
+        """Return one commit message covering every scheduled push and clear the schedule."""
+        commit_message = "; ".join(self._pending_push_messages)
+        self._pending_push_messages = []
+        return commit_message
+
+    def _start_push(self):
+        """Start the scheduled push unless other git work is still running; in that case it starts when that work finishes."""
+        if self._git_busy():
+            return
+
+        self._push_worker = PushWorker(MODULE_DIR, self._take_push_message())
+        self._push_worker.finished.connect(self._on_git_finished)
+        self._push_worker.start()
+
+    def _on_git_finished(self):
+        """Start the push that was scheduled while other git work ran."""
+        if self._pending_push_messages and not self._push_timer.isActive():
+            self._start_push()
+
     def setup_testing_tab(self):
         """Sets up the Testing tab UI."""
         layout = QHBoxLayout()
@@ -138,16 +253,17 @@ class TestLauncher(QMainWindow):
         # Create the tester pane
         tester_layout = QVBoxLayout()
         self.list_widget = QListWidget()
+        self.list_widget.setUniformItemSizes(True)  # All rows are single-line text
         #tester_layout.addWidget(QPushButton("Update All", clicked=self.git_pull))  # Update button
         tester_layout.addWidget(self.list_widget)
 
         # Populate the QListWidget with scripts
-        test_programs_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_programs')
-        for script_name in os.listdir(test_programs_dir):
-            if script_name.endswith('.py') and script_name not in ['dwfconstants.py', 'Enumerate.py']:
-                script_path = os.path.join(test_programs_dir, script_name)
-                self.list_widget.addItem(script_name[:-3])  # Display without '.py'
-                self.script_mapping[script_name[:-3]] = (script_path, test_programs_dir)
+        test_programs_dir = self._test_programs_dir
+        with os.scandir(test_programs_dir) as entries:
+            scripts = [(entry.name[:-3], entry.path) for entry in entries  # Display without '.py'
+                       if entry.name.endswith('.py') and entry.name not in EXCLUDED_TEST_PROGRAMS and entry.is_file()]
+        self.list_widget.addItems([script_name for script_name, _ in scripts])
+        self.script_mapping.update((script_name, (script_path, test_programs_dir)) for script_name, script_path in scripts)
 
         # Connect double-click event to run_test function
         self.list_widget.itemDoubleClicked.connect(self.on_item_double_clicked)
@@ -162,16 +278,33 @@ class TestLauncher(QMainWindow):
         tester_widget.setLayout(tester_layout)
         tester_widget.setFixedWidth(200)
 
-        # Create output area
-        self.output_area = QTextEdit()
+        # Create output area (plain text only, so skip the rich-text engine)
+        self.output_area = QPlainTextEdit()
         self.output_area.setReadOnly(True)
         self.output_area.setMinimumHeight(620)
+        self.output_area.setMaximumBlockCount(OUTPUT_MAX_LINES)  # Drop the oldest lines instead of growing without bound
 
         # Add widgets to main layout
         layout.addWidget(tester_widget)
         layout.addWidget(self.output_area)
         self.testing_tab.setLayout(layout)
 
+    def _maybe_build_reports_tab(self, index):
+        """Build the Reports tab the first time it becomes the current tab, and refresh its report list on later visits."""
+        if self.tab_widget.widget(index) is not self.reports_tab:
+            return
+        if not self._reports_tab_built:
+            self._reports_tab_built = True
+            self._load_report_index()
+            self.setup_reports_tab()
+        else:
+            self._refresh_report_list()
+
+    def _on_reports_changed(self, path):
+        """Refresh the report list when the reports directory changes while the Reports tab is open."""
+        if self.tab_widget.currentWidget() is self.reports_tab:
+            self._refresh_report_list()
+
     def setup_reports_tab(self):
         """Sets up the Reports tab UI."""
         layout = QHBoxLayout()
@@ -188,8 +321,12 @@ class TestLauncher(QMainWindow):
         self.barcode_input = QLineEdit()
         self.barcode_input.setPlaceholderText("Enter Barcode...")
 
-        # Connect the textChanged signal to the filter method
-        self.barcode_input.textChanged.connect(self.filter_reports)
+        # Filter once typing pauses instead of on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(self.filter_reports)
+        self.barcode_input.textChanged.connect(self._filter_timer.start)
 
         load_report_button = QPushButton("Load Report", clicked=self.load_report)
 
@@ -199,6 +336,7 @@ class TestLauncher(QMainWindow):
 
         # List to display filenames
         self.file_list_widget = QListWidget()
+        self.file_list_widget.setUniformItemSizes(True)  # All rows are single-line text
         self.file_list_widget.itemDoubleClicked.connect(self.open_selected_file)
 
         # Add a label for the file list pane
@@ -235,6 +373,12 @@ class TestLauncher(QMainWindow):
 
         self.reports_tab.setLayout(layout)
 
+        # Parse every report once up front and list them all; filtering then only hides rows
+        self._populate_all_reports()
+
+        # Pick up reports added, changed or removed while the tab is open
+        self._watcher.directoryChanged.connect(self._on_reports_changed)
+
     def setup_reports_display_tab(self):
         """Sets up the Reports Display tab UI with a custom right-click context menu."""
         layout = QVBoxLayout()
@@ -264,9 +408,8 @@ class TestLauncher(QMainWindow):
     def slack_share_report(self):
         """Share the current report via Slack."""
         if hasattr(self, 'last_opened_file'):
-            # Load the report content from the last opened file
-            with open(self.last_opened_file, 'r') as file:
-                report_content = json.load(file)
+            # Reuse the parsed report from when it was opened unless the file has changed since
+            report_content = load_report_cached(self.last_opened_file)
             
             # Convert the report content to HTML using report_json_to_html
             report_html = report_json_to_md(report_content)
@@ -340,7 +483,9 @@ class TestLauncher(QMainWindow):
                     "source": source,
                     "red_tag_message": message
                 }
-                add_red_tag_message(structured_message, self.last_opened_file)  # Call the function with the last opened file
+                add_red_tag_message(structured_message, self.last_opened_file, push=False)  # Call the function with the last opened file
+                self._forget_report(self.last_opened_file)
+                self.push_in_background("Added red tag message")
                 self.red_tag_input.clear()  # Clear the input field after adding
                 load_red_tag_messages(self)  # Refresh the display
             else:
@@ -348,125 +493,233 @@ class TestLauncher(QMainWindow):
         else:
             QMessageBox.warning(self, "Input Error", "Please enter a message.")
             
+    def _refresh_report_cache(self):
+        """Bring the cached overall status of every report up to date, re-parsing only files whose mtime_ns changed.
+
+        Returns True if any report was added, changed or removed.
+        """
+        seen = set()
+        changed = False
+        stale = []  # [(report filename, report path, file mtime_ns)] for reports that need reading
+
+        with os.scandir(self._reports_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json') or not entry.is_file():
+                    continue
+                seen.add(entry.name)
+                mtime = entry.stat().st_mtime_ns
+                cached = self._report_cache.get(entry.name)
+                if not cached or cached["mtime"] != mtime:
+                    stale.append((entry.name, entry.path, mtime))
+
+        # Reading is mostly waiting on the disk, so overlap the reads when there are several (e.g. on a cold start)
+        paths = [report_path for _, report_path, _ in stale]
+        if len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=STATUS_READ_WORKERS) as executor:
+                statuses = list(executor.map(self._read_report_status, paths))
+        else:
+            statuses = [self._read_report_status(report_path) for report_path in paths]
+
+        for (report_file, _, mtime), overall_status in zip(stale, statuses):
+            self._report_cache[report_file] = {"status": overall_status, "mtime": mtime}
+            changed = True
+
+        # Drop reports that have been removed from disk
+        for report_file in set(self._report_cache) - seen:
+            del self._report_cache[report_file]
+            changed = True
+
+        # Lowercase the filenames once here rather than on every filter keystroke
+        if changed:
+            self._lowercase_names = sorted((report_file.lower(), report_file) for report_file in self._report_cache)
+            self._save_report_index()
+        return changed
+
+    @staticmethod
+    def _read_report_status(report_path):
+        """Return a report's overall status, or "Unknown" if it cannot be read."""
+        try:
+            return read_overall_status(report_path)
+        except Exception as e:
+            print(f"Error reading report {report_path}: {e}")
+            return "Unknown"
+
+    def _load_report_index(self):
+        """Seed the report status cache from the index saved by a previous run, so only changed reports are re-read."""
+        try:
+            saved = load_json_file(self._report_index_path)["reports"]
+            self._report_cache = {
+                report_file: entry for report_file, entry in saved.items()
+                if isinstance(entry, dict) and isinstance(entry.get("status"), str) and isinstance(entry.get("mtime"), int)
+            }
+        except (OSError, ValueError, LookupError, TypeError, AttributeError):
+            return  # No usable index; every report is read on the first refresh
+
+        self._lowercase_names = sorted((report_file.lower(), report_file) for report_file in self._report_cache)
+
+    def _save_report_index(self):
+        """Write the report status cache to disk for the next run."""
+        try:
+            write_json_file(self._report_index_path, {"reports": self._report_cache})
+        except OSError as e:
+            print(f"Error saving report index: {e}")
+
+    def _make_status_item(self, report_file, overall_status):
+        """Create a report list item colored by its overall status."""
+        item = QListWidgetItem(report_file)
+
+        # Reuse the shared brushes rather than building new QBrush and QColor objects per item
+        background, foreground = STATUS_BRUSHES.get(overall_status.lower(), UNKNOWN_STATUS_BRUSHES)
+        item.setBackground(background)
+        item.setForeground(foreground)
+
+        # Keep the status on the item so it can be sorted or filtered without re-reading the report
+        item.setData(Qt.UserRole, overall_status)
+        return item
+
+    def _rebuild_file_list(self, report_files):
+        """Replace the contents of the report list with the given report files, colored by overall status."""
+        # Freeze the list while it is rebuilt so it repaints once at the end
+        self.file_list_widget.setUpdatesEnabled(False)
+        self.file_list_widget.blockSignals(True)
+        try:
+            self.file_list_widget.clear()
+
+            for report_file in report_files:
+                self.file_list_widget.addItem(self._make_status_item(report_file, self._report_cache[report_file]["status"]))
+        finally:
+            self.file_list_widget.blockSignals(False)
+            self.file_list_widget.setUpdatesEnabled(True)
+
+    def _populate_all_reports(self):
+        """Make the report list hold every report, rebuilding it only when the reports on disk have changed."""
+        changed = self._refresh_report_cache()
+        self._list_cached_reports(changed)
+
+    def _list_cached_reports(self, rebuild=False):
+        """Make the report list hold every cached report, rebuilding it if asked to or if it no longer holds them all."""
+        if rebuild or self.file_list_widget.count() != len(self._lowercase_names):
+            self._rebuild_file_list(report_file for _, report_file in self._lowercase_names)
+
+    def _refresh_report_list(self):
+        """Bring the report list up to date with the reports on disk and re-apply the current filter."""
+        self._populate_all_reports()
+        self._apply_report_filter(self.barcode_input.text().strip().lower())
+
+    def _apply_report_filter(self, barcode):
+        """Hide the report rows whose name does not contain the lowercase barcode."""
+        # Rows are built in _lowercase_names order, so row i matches entry i
+        self.file_list_widget.setUpdatesEnabled(False)
+        try:
+            for i, (lowercase_name, _) in enumerate(self._lowercase_names):
+                self.file_list_widget.item(i).setHidden(barcode not in lowercase_name)
+        finally:
+            self.file_list_widget.setUpdatesEnabled(True)
+
     def filter_reports(self):
         """Filter the report list based on the barcode input."""
         barcode = self.barcode_input.text().strip().lower()
         print(f"Filtering reports with barcode: {barcode}")
-        self.file_list_widget.clear()
-
-        reports_dir = os.path.join(self.parent_dir, 'testing_hub', 'reports')
-        report_files = [f for f in os.listdir(reports_dir) if f.endswith('.json')]
-
-        for report_file in report_files:
-            if barcode in report_file.lower():
-                item = QListWidgetItem(report_file)
-                with open(os.path.join(reports_dir, report_file), 'r') as file:
-                    report_content = json.load(file)
-                    overall_status = report_content.get("test_reports", [{}])[0].get("overall_status", "Unknown")
-
-                # Use QBrush and QColor for correct color setting
-                if overall_status.lower() == "pass":
-                    item.setBackground(QBrush(QColor("darkgreen")))
-                    item.setForeground(QBrush(QColor("white")))
-                elif overall_status.lower() == "fail":
-                    item.setBackground(QBrush(QColor("red")))
-                    item.setForeground(QBrush(QColor("white")))
-                else:
-                    item.setBackground(QBrush(QColor("lightgray")))
-                    item.setForeground(QBrush(QColor("black")))
 
-                self.file_list_widget.addItem(item)
+        # Only hide rows here; the reports on disk are re-checked on tab show, Load Report and directory changes
+        self._list_cached_reports()
+        self._apply_report_filter(barcode)
 
     def load_report(self):
         """Load the report corresponding to the entered barcode or show all files if blank."""
         barcode = self.barcode_input.text().strip()
 
         if not barcode:
-            self.file_list_widget.clear()
-            reports_dir = os.path.join(self.parent_dir, 'testing_hub', 'reports')
+            self._populate_all_reports()
+            self._apply_report_filter("")
 
-            # Retrieve and sort report files
-            report_files = [f for f in os.listdir(reports_dir) if f.endswith('.json')]
-            report_files.sort()  # Sort the report files alphabetically
-
-            for report_file in report_files:
-                report_file_path = os.path.join(reports_dir, report_file)
-                with open(report_file_path, 'r') as file:
-                    report_content = json.load(file)
-                    overall_status = report_content.get("test_reports", [{}])[0].get("overall_status", "Unknown")
-
-                item = QListWidgetItem(report_file)
-
-                # Apply the color scheme based on the overall_status
-                if overall_status.lower() == "pass":
-                    item.setBackground(QBrush(QColor("darkgreen")))
-                    item.setForeground(QBrush(QColor("white")))
-                elif overall_status.lower() == "fail":
-                    item.setBackground(QBrush(QColor("red")))
-                    item.setForeground(QBrush(QColor("white")))
-                else:
-                    item.setBackground(QBrush(QColor("lightgray")))
-                    item.setForeground(QBrush(QColor("black")))
-
-                self.file_list_widget.addItem(item)
-
-            self.report_display.clear()
-            self.red_tag_display.clear()
-            self.process_flow_display.clear()
+            self._clear_report_displays()
         else:
             board_name, board_rev, board_var, board_sn = parse_pcb_barcode(barcode)
             board_id = f"{board_name}-{board_rev}-{board_var}-{board_sn}"
             report_file_name = f"{board_name}-{board_rev}-{board_var}-{board_sn}.json"
-            report_file_path = os.path.join(self.parent_dir, 'testing_hub', 'reports', report_file_name)
+            report_file_path = os.path.join(self._reports_dir, report_file_name)
 
             print(f"Looking for report file: {report_file_path}")
 
             if os.path.exists(report_file_path):
-                with open(report_file_path, 'r') as file:
-                    report_content = json.load(file)
-                self.report_display.setHtml(report_json_to_html(report_content))
-                self.red_tag_display.setHtml(red_tag_messages_json_to_html(report_content))
-                self.process_flow_display.setHtml(process_flow_json_to_html(report_content))
+                rendered = self._render_report(report_file_path)
+                self._show_report_html(rendered)
+                test_reports = rendered[3]
                 self.file_list_widget.clear()
                 self.last_opened_file = report_file_path
 
-                test_reports = report_content.get('test_reports', [])
                 if test_reports:
-                    images_dir = os.path.join(self.parent_dir, 'testing_hub', 'images')
-                    self.setup_images_tab(test_reports, images_dir)
+                    self.setup_images_tab(test_reports, self._images_dir)
                 else:
                     self.remove_images_tab()
             else:
-                self.report_display.clear()
-                self.red_tag_display.clear()
-                self.process_flow_display.clear()
+                self._clear_report_displays()
                 report_dialog = ReportNotFoundDialog(board_id, report_file_name, report_file_path, self)
                 report_dialog.exec_()
 
+    def _render_report(self, file_path):
+        """Return (report_html, red_tag_html, process_flow_html, test_reports) for a report file, reusing the previous render while the file is unchanged."""
+        stat = os.stat(file_path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._html_cache.get(file_path)
+        if cached and cached[0] == key:
+            self._html_cache.move_to_end(file_path)
+            return cached[1]
+
+        report_content = load_report_cached(file_path)
+        rendered = (
+            report_json_to_html(report_content),
+            red_tag_messages_json_to_html(report_content),
+            process_flow_json_to_html(report_content),
+            report_content.get('test_reports', [])
+        )
+
+        self._html_cache[file_path] = (key, rendered)
+        self._html_cache.move_to_end(file_path)
+        if len(self._html_cache) > HTML_CACHE_SIZE:
+            self._html_cache.popitem(last=False)  # Evict the least recently viewed report
+        return rendered
+
+    def _forget_report(self, file_path):
+        """Drop every cached copy of a report after it has been rewritten."""
+        invalidate_report_cache(file_path)
+        self._html_cache.pop(file_path, None)
+        self._displayed_render = None
+
+    def _show_report_html(self, rendered):
+        """Show a rendered report in the display tabs, skipping the HTML re-parse when that render is already shown."""
+        if rendered is self._displayed_render:
+            return
+
+        report_html, red_tag_html, process_flow_html, _ = rendered
+        self.report_display.setHtml(report_html)
+        self.red_tag_display.setHtml(red_tag_html)
+        self.process_flow_display.setHtml(process_flow_html)
+        self._displayed_render = rendered
+
+    def _clear_report_displays(self):
+        """Clear the report, red tag and process flow display tabs."""
+        self.report_display.clear()
+        self.red_tag_display.clear()
+        self.process_flow_display.clear()
+        self._displayed_render = None
+
     def open_selected_file(self, item):
         """Open the selected report file from the list and populate the sub-tabs."""
         filename = item.text()
-        reports_dir = os.path.join(self.parent_dir, 'testing_hub', 'reports')
-        images_dir = os.path.join(self.parent_dir, 'testing_hub', 'images')
-        file_path = os.path.join(reports_dir, filename)
+        file_path = os.path.join(self._reports_dir, filename)
 
         try:
-            with open(file_path, 'r') as file:
-                report_content = json.load(file)
-
-            # Display the report content in the report display area
-            self.report_display.setHtml(report_json_to_html(report_content))
-
-            # Display red tag messages
-            self.red_tag_display.setHtml(red_tag_messages_json_to_html(report_content))
+            rendered = self._render_report(file_path)
 
-            # Display process flow content
-            self.process_flow_display.setHtml(process_flow_json_to_html(report_content))
+            # Display the report content, red tag messages and process flow content
+            self._show_report_html(rendered)
 
             # Check for images in the report
-            test_reports = report_content.get('test_reports', [])
+            test_reports = rendered[3]
             if test_reports:
-                self.setup_images_tab(test_reports, images_dir)
+                self.setup_images_tab(test_reports, self._images_dir)
             else:
                 self.remove_images_tab()
 
@@ -506,29 +759,54 @@ class TestLauncher(QMainWindow):
                 sub_tab_layout = QVBoxLayout()
 
                 for image_filename in images:
-                    image_path = os.path.join(images_dir, image_filename)
-
-                    # Create a custom QLabel for image handling
-                    report_image_label = ImageLabel()
-
-                    # Load the image
-                    pixmap = QPixmap(image_path)
-
-                    # Set the pixmap directly to QLabel
-                    report_image_label.setPixmap(pixmap)
-                    report_image_label.setAlignment(Qt.AlignCenter)
-
-                    # Add the QLabel to the sub-tab layout
-                    sub_tab_layout.addWidget(report_image_label)
+                    # Add a label for each image to the sub-tab layout
+                    sub_tab_layout.addWidget(self._make_image_label(os.path.join(images_dir, image_filename)))
 
                 sub_tab.setLayout(sub_tab_layout)
 
                 # Add the sub-tab to the tab widget with the timestamp as the title
                 self.images_tab_layout.addTab(sub_tab, timestamp)
 
-                # Allow each label to expand
-                for i in range(sub_tab_layout.count()):
-                    sub_tab_layout.itemAt(i).widget().setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+    def _make_image_label(self, image_path):
+        """Create an expanding label for an image; the image is decoded when the label is first shown."""
+        report_image_label = ImageLabel()
+        report_image_label.image_path = image_path
+        report_image_label.pixmap_loader = self._load_pixmap
+        report_image_label.setAlignment(Qt.AlignCenter)
+        report_image_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        return report_image_label
+
+    def _add_image_to_subtab(self, timestamp, image_path):
+        """Add one image to the sub-tab titled with its report's timestamp, creating that sub-tab if needed."""
+        for index in range(self.images_tab_layout.count()):
+            if self.images_tab_layout.tabText(index) == timestamp:
+                sub_tab = self.images_tab_layout.widget(index)
+                break
+        else:
+            sub_tab = QWidget()
+            sub_tab.setLayout(QVBoxLayout())
+            self.images_tab_layout.addTab(sub_tab, timestamp)
+
+        sub_tab.layout().addWidget(self._make_image_label(image_path))
+
+    def _load_pixmap(self, image_path):
+        """Return the decoded image at image_path, reusing recently decoded images."""
+        pixmap = self._pixmap_cache.get(image_path)
+        if pixmap is None:
+            pixmap = QPixmap(image_path)
+            self._pixmap_cache[image_path] = pixmap
+            self._pixmap_cache_bytes += self._pixmap_bytes(pixmap)
+            # Evict the least recently shown images until the cache fits, always keeping the one just decoded
+            while self._pixmap_cache_bytes > PIXMAP_CACHE_BYTES and len(self._pixmap_cache) > 1:
+                _, evicted = self._pixmap_cache.popitem(last=False)
+                self._pixmap_cache_bytes -= self._pixmap_bytes(evicted)
+        self._pixmap_cache.move_to_end(image_path)
+        return pixmap
+
+    @staticmethod
+    def _pixmap_bytes(pixmap):
+        """Return the memory used by a decoded image."""
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
 
     def remove_images_tab(self):
         """Remove the images tab if it exists."""
@@ -560,8 +838,7 @@ class TestLauncher(QMainWindow):
                 # Update the report file with the new image
                 report_file_path = os.path.join(parent_dir, 'testing_hub', 'reports', report_file_name)
                 if os.path.exists(report_file_path):
-                    with open(report_file_path, 'r') as file:
-                        report_content = json.load(file)
+                    report_content = load_json_file(report_file_path)
 
                     # Ensure 'test_reports' exists and has at least one report
                     if 'test_reports' not in report_content or not report_content['test_reports']:
@@ -570,23 +847,26 @@ class TestLauncher(QMainWindow):
                     # Find the correct test report based on the timestamp
                     for test_report in report_content['test_reports']:
                         if test_report.get('timestamp') == timestamp:
-                            # Ensure the 'images' field exists and append the new image
-                            test_report.setdefault('images', []).append(new_image_name)
                             break
                     else:
                         # If no matching timestamp, append the image to the first report
-                        report_content['test_reports'][0].setdefault('images', []).append(new_image_name)
+                        test_report = report_content['test_reports'][0]
+
+                    # Ensure the 'images' field exists and append the new image
+                    test_report.setdefault('images', []).append(new_image_name)
 
-                    # Write back the updated report
-                    with open(report_file_path, 'w') as file:
-                        json.dump(report_content, file, indent=4)
+                    # Write back the updated report and drop its cached copies
+                    write_json_file(report_file_path, report_content)
+                    self._forget_report(report_file_path)
 
-                    # Push to github
-                    REPO_DIR = os.path.dirname(os.path.abspath(__file__))
-                    push_to_github(REPO_DIR, "Added image")
+                    # Push to github without blocking the UI
+                    self.push_in_background("Added image")
 
-                    # Refresh the images tab to display the newly added image
-                    self.setup_images_tab(report_content['test_reports'], images_dir)
+                    # Show the new image without rebuilding the other image tabs
+                    if hasattr(self, 'images_tab'):
+                        self._add_image_to_subtab(test_report.get('timestamp', 'No Timestamp'), target_image_path)
+                    else:
+                        self.setup_images_tab(report_content['test_reports'], images_dir)
 
                     #QMessageBox.information(None, "Success", f"Image uploaded and report updated successfully: {new_image_name}")
                 else:
@@ -608,15 +888,14 @@ class TestLauncher(QMainWindow):
 
     def update_report_with_image(self, report_path, image_filename):
         """Update the JSON report to include the new image."""
-        with open(report_path, 'r') as file:
-            report_content = json.load(file)
+        report_content = load_json_file(report_path)
 
         # Assuming you want to add the image to the first test report
         if report_content.get("test_reports"):
             report_content["test_reports"][0].setdefault("images", []).append(image_filename)
 
-        with open(report_path, 'w') as file:
-            json.dump(report_content, file, indent=4)
+        write_json_file(report_path, report_content)
+        self._forget_report(report_path)
 
     def setup_message_reader_tab(self):
         """Sets up the Message Reader tab UI."""
@@ -626,6 +905,7 @@ class TestLauncher(QMainWindow):
         side_panel_layout = QVBoxLayout()
         
         self.board_list_widget = QListWidget()
+        self.board_list_widget.setUniformItemSizes(True)  # All rows are single-line text
         self.board_list_widget.setFixedWidth(250)  # Set fixed width to 250 pixels
         
         # Connect double-click event to load messages for the selected board
@@ -643,88 +923,161 @@ class TestLauncher(QMainWindow):
         layout.addWidget(self.message_display)
         self.message_reader_tab.setLayout(layout)
 
-        # Load board names into the list
-        self.load_board_names()
+        # Board names are loaded when the tab is first shown; keep them current while it is open
+        self._watcher = QFileSystemWatcher([self._reports_dir], self)
+        self._watcher.directoryChanged.connect(self._refresh_index)
 
     def load_board_names(self):
-        """Load board names into the side panel list widget."""
+        """Load board names into the side panel list widget and index the reports of each board."""
         self.board_list_widget.clear()  # Clear existing items
-
-        reports_dir = os.path.join(self.parent_dir, 'testing_hub', 'reports')  # Path to reports directory
-
-        # Use a set to store unique board names
-        board_names_set = set()
+        self._board_index.clear()
 
         # Scan the reports directory
         try:
-            for filename in os.listdir(reports_dir):
+            reports_prefix = os.path.join(self._reports_dir, '')  # Directory with a trailing separator, joined once
+            for filename in cached_listdir(self._reports_dir):
                 if filename.endswith('.json'):  # Assuming report files are JSON
                     # Extract the board name from the filename
-                    board_name = filename.split('-')[0]  # Adjust based on your naming convention
-                    board_names_set.add(board_name)  # Add to the set for uniqueness
+                    board_name = filename.partition('-')[0]  # Adjust based on your naming convention
+                    self._board_index[board_name].append(reports_prefix + filename)
 
-            # Convert set to sorted list and add to the list widget
-            unique_board_names = sorted(board_names_set)
-            self.board_list_widget.addItems(unique_board_names)
+            # Add the sorted, unique board names to the list widget
+            self.board_list_widget.addItems(sorted(self._board_index))
+
+            # Forget the sorted messages of reports that are no longer on disk
+            indexed = {path for paths in self._board_index.values() for path in paths}
+            self._sorted_messages = {path: cached for path, cached in self._sorted_messages.items() if path in indexed}
 
         except Exception as e:
             print(f"Error loading board names: {e}")
 
+    def _maybe_refresh_boards(self, index):
+        """Rebuild the board index when the Message Reader tab is shown and the reports directory has changed."""
+        if self.tab_widget.widget(index) is not self.message_reader_tab:
+            return
+        try:
+            mtime = os.stat(self._reports_dir).st_mtime
+        except OSError:
+            mtime = None
+        if self._boards_mtime is not None and mtime == self._boards_mtime:
+            return
+        self.load_board_names()
+        self._boards_mtime = mtime
+
+    def _refresh_index(self, path):
+        """Rebuild the board index and list when the reports directory changes while the Message Reader tab is open."""
+        self._maybe_refresh_boards(self.tab_widget.currentIndex())
+
     def load_messages_for_board(self, item):
         """Load messages for the selected board and display them in HTML format."""
         board_name = item.text()
-        reports_dir = os.path.join(self.parent_dir, 'testing_hub', 'reports')
-        all_messages = []
-
-        # Scan the reports directory for relevant files
-        for filename in os.listdir(reports_dir):
-            if board_name in filename and filename.endswith('.json'):
-                report_file_path = os.path.join(reports_dir, filename)
-                try:
-                    with open(report_file_path, 'r') as file:
-                        report_content = json.load(file)
-                        # Add red tag messages
-                        all_messages.extend(report_content.get("red_tag_messages", []))
-                except Exception as e:
-                    print(f"Error loading messages from {report_file_path}: {e}")
-
-        # Sort messages by red tag message
-        all_messages.sort(key=lambda x: x.get("red_tag_message", "").lower())  # Use lower() for case-insensitive sorting
-        
+        sorted_lists = []
+
+        # Look up the board's report files in the index
+        for report_file_path in self._board_index.get(board_name, []):
+            try:
+                # Re-read and re-sort a report's red tag messages only when the file has changed
+                stat = os.stat(report_file_path)
+                key = (stat.st_mtime_ns, stat.st_size)
+                cached = self._sorted_messages.get(report_file_path)
+                if cached is None or cached[0] != key:
+                    report_content = load_report_cached(report_file_path)
+                    cached = (key, sorted(report_content.get("red_tag_messages", []), key=red_tag_sort_key))
+                    self._sorted_messages[report_file_path] = cached
+                sorted_lists.append(cached[1])
+            except Exception as e:
+                print(f"Error loading messages from {report_file_path}: {e}")
+
+        # Merge the per-report lists, which are already sorted by red tag message
+        all_messages = list(heapq.merge(*sorted_lists, key=red_tag_sort_key))
+
         # Convert messages to HTML and display
         html = messages_to_html(all_messages)
         self.message_display.setHtml(html)
 
     def git_pull(self):
-        """Function to run git fetch and then git pull command in the current script's directory."""
+        """Function to run git pull in the current script's directory without blocking the UI."""
         # Get the directory where the script is located
-        script_dir = os.path.dirname(os.path.abspath(__file__))
+        script_dir = MODULE_DIR
 
         # Check if the directory contains a .git folder
         if not os.path.isdir(os.path.join(script_dir, '.git')):
             self.append_output("Error: The directory is not a valid Git repository.")
             return
 
-        try:
-            # Run git fetch and pull commands
-            subprocess.check_call(['git', 'fetch'], cwd=script_dir)
-            subprocess.check_call(['git', 'pull'], cwd=script_dir)
+        if self._git_busy():
+            self.append_output("An update or push is already in progress. Please try again shortly.")
+            return
+
+        # A single fast-forward pull fetches and merges in one network round trip
+        self.append_output("Pulling from the repository...")
+        self.git_process.setWorkingDirectory(script_dir)
+        self.git_process.start('git', ['pull', '--ff-only'])
+
+    def _read_git_output(self):
+        """Appends each complete line git has written so far."""
+        self._append_process_lines(self.git_process)
+
+    def on_git_pull_finished(self, exit_code, exit_status):
+        """Reports the result of the background git pull."""
+        self._read_git_output()
+        remainder = self.git_process.readAll()
+        if remainder:
+            self.append_output(self._decode_output(remainder))
+
+        if exit_status == QProcess.NormalExit and exit_code == 0:
             self.append_output("Successfully pulled from the repository.")
-        except subprocess.CalledProcessError as e:
-            self.append_output(f"Error during git pull: {e}")
+        else:
+            self.append_output(f"Error during git pull (exit code {exit_code}).")
+        self._on_git_finished()
+
+    def _on_git_error(self, error):
+        """Reports a git pull that could not be started."""
+        if error == QProcess.FailedToStart:
+            self.append_output(f"Error during git pull: {self.git_process.errorString()}")
+            self._on_git_finished()
 
     def run_test(self, script, directory):
-        if self.runner and self.runner.isRunning():
+        if self.runner.state() != QProcess.NotRunning:
             QMessageBox.warning(self, "Warning", "A test is already running.")
             return
 
-        self.runner = TestRunner(script, directory)
-        self.runner.output_signal.connect(self.append_output)
-        self.runner.error_signal.connect(self.append_output)
-        self.runner.start()
+        # Launch the script with this interpreter directly, in its own directory
+        self.runner.setWorkingDirectory(directory)
+        self.runner.start(sys.executable, ['-u', script])
+
+    def _read_test_output(self, channel):
+        """Appends each complete line the running test has written to the given channel."""
+        self.runner.setReadChannel(channel)
+        self._append_process_lines(self.runner)
+
+    def _flush_test_output(self):
+        """Appends any trailing output without a final newline once the test has exited."""
+        for channel in (QProcess.StandardOutput, QProcess.StandardError):
+            self._read_test_output(channel)
+            self.runner.setReadChannel(channel)
+            remainder = self.runner.readAll()
+            if remainder:
+                self.append_output(self._decode_output(remainder))
+
+    def _append_process_lines(self, process):
+        """Appends every complete line available on a process's read channel in a single update of the output pane."""
+        lines = []
+        while process.canReadLine():
+            lines.append(self._decode_output(process.readLine()))
+        if lines:
+            self.append_output('\n'.join(lines))
+
+    def _decode_output(self, data):
+        """Decodes raw process output the same way a text-mode pipe would."""
+        return bytes(data).decode(locale.getpreferredencoding(False), errors='replace').strip()
+
+    def _on_test_error(self, error):
+        """Reports a test that could not be started or crashed."""
+        self.append_output(f"Error running test: {self.runner.errorString()}")
 
     def append_output(self, text):
-        self.output_area.append(text)
+        self.output_area.appendPlainText(text)
         self.output_area.moveCursor(self.output_area.textCursor().End)
 
     def clear_output(self):
@@ -737,8 +1090,12 @@ class TestLauncher(QMainWindow):
         self.run_test(script, directory)
     
     def open_process_message_dialog(self):
-        dialog = ProcessMessageDialog(self)
-        dialog.exec_()
+        # Build the dialog once and reuse it, picking up any change to the JSON file (e.g. from a git pull) before showing it
+        if self._process_message_dialog is None:
+            self._process_message_dialog = ProcessMessageDialog(self, push=self.push_in_background)
+        else:
+            self._process_message_dialog.reload_messages()
+        self._process_message_dialog.exec_()
 
 class ReportNotFoundDialog(QDialog):
     def __init__(self, board_id, report_file_name, report_file_path, parent=None):
@@ -783,8 +1140,7 @@ class ReportNotFoundDialog(QDialog):
         report_file_path = self.report_file_path
 
         try:
-            with open(report_file_path, 'w') as file:
-                json.dump(report_data, file, indent=4)
+            write_json_file(report_file_path, report_data)
 
             QMessageBox.information(self, "Success", f"Report file '{os.path.basename(report_file_path)}' created successfully!")
             self.accept()  # Close the dialog after creating the report
@@ -796,6 +1152,14 @@ class ImageLabel(QLabel):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.pixmap = None
+        self.image_path = None  # Image to decode the first time the label is shown
+        self.pixmap_loader = QPixmap
+
+    def showEvent(self, event):
+        """Decode the pending image once the label actually becomes visible."""
+        if self.pixmap is None and self.image_path:
+            self.setPixmap(self.pixmap_loader(self.image_path))
+        super().showEvent(event)
 
     def setPixmap(self, pixmap):
         """Override to store the original pixmap."""
@@ -809,26 +1173,78 @@ class ImageLabel(QLabel):
             super().setPixmap(scaled_pixmap)
         super().resizeEvent(event)
 
+class MessageStore:
+    """Single owner of the process messages in apply_messages.json; re-reads the file only when it changes."""
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Returns the shared store, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls(APPLY_MESSAGES_PATH)
+        return cls._instance
+
+    def __init__(self, path):
+        self.path = path
+        self.data = {}  # Whole JSON document, so saving keeps the other fields
+        self.mtime_ns = None
+        self.messages = ()  # Messages as last read from or written to the file
+
+    def get(self):
+        """Returns a copy of the process messages, or None if the file does not exist."""
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        # Only parse the file again if it changed since it was last read
+        if mtime_ns != self.mtime_ns:
+            data = load_json_file(self.path)
+            # Intern the messages and drop repeated entries, keeping the first occurrence of each
+            self.messages = tuple(dict.fromkeys(sys.intern(message) for message in data.get("process_messages", []) if isinstance(message, str)))
+            self.data = data
+            self.mtime_ns = mtime_ns
+        return list(self.messages)
+
+    def set(self, messages):
+        """Saves the process messages, skipping the write when they are unchanged."""
+        messages = tuple(messages)
+        if messages == self.messages:
+            return
+
+        # Only re-read the existing data if the file changed since it was loaded
+        try:
+            if os.stat(self.path).st_mtime_ns != self.mtime_ns:
+                self.data = load_json_file(self.path)
+        except FileNotFoundError:
+            pass
+
+        # Save back to the JSON file in a single write
+        self.data["process_messages"] = list(messages)
+        write_json_file(self.path, self.data)
+        self.mtime_ns = os.stat(self.path).st_mtime_ns
+        self.messages = messages
+
 class ProcessMessageDialog(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, push=None):
         super().__init__(parent)
+        self._push = push  # Schedules a push of new report files; passed on to the apply dialog
         self.setWindowTitle("Apply Process Message")
         self.setMinimumSize(400, 300)
 
         # Load messages from the JSON file
+        self._store = MessageStore.instance()
         self.messages = self.load_messages_from_json()
 
-        # Layout for radio buttons
         layout = QVBoxLayout(self)
         self.selected_message = None
-        self.radio_buttons = []
 
-        # Create radio buttons for each message
-        for message in self.messages:
-            radio_button = QRadioButton(message)
-            radio_button.toggled.connect(self.on_message_selected)
-            layout.addWidget(radio_button)
-            self.radio_buttons.append(radio_button)
+        # Single-selection list with one row per message, kept in the same order as self.messages
+        self.message_list = QListWidget()
+        self.message_list.setUniformItemSizes(True)
+        self.message_list.addItems(self.messages)
+        self.message_list.currentItemChanged.connect(self.on_message_selected)
+        layout.addWidget(self.message_list)
 
         # Buttons for Edit, Apply, Add, Delete
         button_layout = QHBoxLayout()
@@ -853,60 +1269,51 @@ class ProcessMessageDialog(QDialog):
 
     def load_messages_from_json(self):
         """Load process messages from the JSON file."""
-        json_file = "apply_messages.json"  # Path to your JSON file
-
-        if os.path.exists(json_file):
-            with open(json_file, 'r') as file:
-                data = json.load(file)
-                return data.get("process_messages", [])
-        else:
+        messages = self._store.get()
+        if messages is None:
             QMessageBox.warning(self, "Error", "JSON file not found.")
             return []
+        return messages
 
-    def save_messages_to_json(self):
-        """Save the updated messages to the JSON file."""
-        json_file = "apply_messages.json"
-
-        # Load the existing data
-        with open(json_file, 'r') as file:
-            data = json.load(file)
+    def reload_messages(self):
+        """Refill the message list if the JSON file changed since it was last shown, keeping the selection if it still exists."""
+        messages = self._store.get()
+        if messages is None or messages == self.messages:
+            return
 
-        # Update the process_messages field with the new list
-        data["process_messages"] = self.messages
+        selected = self.selected_message
+        self.messages = messages
+        self.message_list.clear()
+        self.message_list.addItems(self.messages)
+        self.selected_message = None
+        if selected in self.messages:
+            self.message_list.setCurrentRow(self.messages.index(selected))
 
-        # Save back to the JSON file
-        with open(json_file, 'w') as file:
-            json.dump(data, file, indent=4)
+    def save_messages_to_json(self):
+        """Save the updated messages to the JSON file."""
+        self._store.set(self.messages)
 
-    def on_message_selected(self):
-        """Set the selected message when a radio button is toggled."""
-        for radio_button in self.radio_buttons:
-            if radio_button.isChecked():
-                self.selected_message = radio_button.text()
-                break
+    def on_message_selected(self, current, previous):
+        """Set the selected message when the current row of the message list changes."""
+        self.selected_message = current.text() if current else None
 
     def edit_message(self):
         """Edit the selected process message."""
         if self.selected_message:
             text, ok = QInputDialog.getText(self, "Edit Message", "Edit the selected message:", text=self.selected_message)
             if ok and text:
-                # Update the message in the list
-                for i, message in enumerate(self.messages):
-                    if message == self.selected_message:
-                        self.messages[i] = text
-                        self.selected_message = text
-                        # Update the radio button text
-                        for radio_button in self.radio_buttons:
-                            if radio_button.isChecked():
-                                radio_button.setText(text)
-                        break
+                # Update the message and its row in the list
+                row = self.message_list.currentRow()
+                self.messages[row] = text
+                self.message_list.item(row).setText(text)
+                self.selected_message = text
                 # Save the updated messages to the JSON file
                 self.save_messages_to_json()
 
     def apply_message(self):
         """Open the ApplyMessageDialog to scan barcodes and apply the selected message."""
         if self.selected_message:
-            apply_dialog = ApplyMessageDialog(self.selected_message, self)
+            apply_dialog = ApplyMessageDialog(self.selected_message, self, push=self._push)
             apply_dialog.exec_()
         else:
             QMessageBox.warning(self, "Error", "No message selected.")
@@ -918,11 +1325,8 @@ class ProcessMessageDialog(QDialog):
             # Add the new message to the list
             self.messages.append(text)
 
-            # Add a new radio button for the new message
-            new_radio_button = QRadioButton(text)
-            new_radio_button.toggled.connect(self.on_message_selected)
-            self.radio_buttons.append(new_radio_button)
-            self.layout().insertWidget(len(self.radio_buttons) - 1, new_radio_button)  # Insert at the right position
+            # Add a row for the new message
+            self.message_list.addItem(text)
 
             # Save the updated messages to the JSON file
             self.save_messages_to_json()
@@ -933,17 +1337,13 @@ class ProcessMessageDialog(QDialog):
             confirm = QMessageBox.question(self, "Delete Message", f"Are you sure you want to delete '{self.selected_message}'?",
                                            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
             if confirm == QMessageBox.Yes:
-                # Remove the selected message from the list
-                self.messages = [message for message in self.messages if message != self.selected_message]
-
-                # Find and remove the corresponding radio button
-                for radio_button in self.radio_buttons:
-                    if radio_button.text() == self.selected_message:
-                        radio_button.setParent(None)  # Remove the radio button from the layout
-                        self.radio_buttons.remove(radio_button)
-                        break
+                # Remove the selected message and its row from the list
+                row = self.message_list.currentRow()
+                del self.messages[row]
+                self.message_list.takeItem(row)
 
                 # Clear the selected message
+                self.message_list.setCurrentRow(-1)
                 self.selected_message = None
 
                 # Save the updated messages to the JSON file
@@ -952,12 +1352,18 @@ class ProcessMessageDialog(QDialog):
             QMessageBox.warning(self, "Error", "No message selected.")
 
 class ApplyMessageDialog(QDialog):
-    def __init__(self, selected_message, parent=None):
+    def __init__(self, selected_message, parent=None, push=None):
         super().__init__(parent)
         self.setWindowTitle("Apply Process Message")
         self.setMinimumSize(400, 200)
 
         self.selected_message = selected_message
+        self._push_pending = False  # Set when a new report file is created; pushed once when the dialog closes
+        self._push = push  # Schedules a push in the background; without one, the push runs when the dialog closes
+
+        # Reports folder for this scanning session, created once rather than on every scan
+        self.reports_dir = os.path.join(MODULE_DIR, "reports")
+        os.makedirs(self.reports_dir, exist_ok=True)
 
         layout = QVBoxLayout(self)
 
@@ -972,7 +1378,7 @@ class ApplyMessageDialog(QDialog):
         layout.addWidget(self.barcode_input)
 
         # Text area to show feedback or the status of scanned barcodes
-        self.feedback_area = QTextEdit(self)
+        self.feedback_area = QPlainTextEdit(self)
         self.feedback_area.setReadOnly(True)
         layout.addWidget(self.feedback_area)
 
@@ -990,20 +1396,19 @@ class ApplyMessageDialog(QDialog):
         board_name, board_rev, board_var, board_sn = parse_pcb_barcode(barcode)
 
         # Construct the JSON filename based on the parsed components and place it in the "reports" folder
-        reports_dir = "reports"
-        os.makedirs(reports_dir, exist_ok=True)  # Ensure the reports folder exists
-        json_file = os.path.join(reports_dir, f"{board_name}-{board_rev}-{board_var}-{board_sn.split('-')[0]}.json")
+        json_file = os.path.join(self.reports_dir, f"{board_name}-{board_rev}-{board_var}-{board_sn.split('-')[0]}.json")
 
         # Check if the JSON file exists
+        data = None
         if not os.path.exists(json_file):
-            self.feedback_area.append(f"JSON file for {json_file} not found. Creating a new one.")
+            self.feedback_area.appendPlainText(f"JSON file for {json_file} not found. Creating a new one.")
             # Create a new JSON file with the default structure
-            self.create_new_json_file(json_file, board_name, board_rev, board_var, board_sn)
+            data = self.create_new_json_file(json_file, board_name, board_rev, board_var, board_sn)
 
         try:
-            # Load the existing data from the JSON file
-            with open(json_file, 'r') as file:
-                data = json.load(file)
+            # Load the existing data from the JSON file, unless it was just created
+            if data is None:
+                data = load_json_file(json_file)
 
             # Get the current date and time
             current_datetime = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -1018,18 +1423,17 @@ class ApplyMessageDialog(QDialog):
                 "timestamp": current_datetime
             })
 
-            # Save the updated data back to the JSON file
-            with open(json_file, 'w') as file:
-                json.dump(data, file, indent=4)
+            # Save the updated data back to the JSON file in a single write
+            write_json_file(json_file, data)
 
             # Provide feedback to the user
-            self.feedback_area.append(f"Applied message to {json_file}: {self.selected_message} at {current_datetime}")
+            self.feedback_area.appendPlainText(f"Applied message to {json_file}: {self.selected_message} at {current_datetime}")
 
         except Exception as e:
-            self.feedback_area.append(f"Error processing {json_file}: {e}")
+            self.feedback_area.appendPlainText(f"Error processing {json_file}: {e}")
 
     def create_new_json_file(self, json_file, board_name, board_rev, board_var, board_sn):
-        """Creates a new JSON file with a default structure."""
+        """Creates a new JSON file with a default structure and returns its data, or None if it could not be created."""
         try:
             # Default structure of a new report JSON file
             new_data = {
@@ -1046,22 +1450,35 @@ class ApplyMessageDialog(QDialog):
             }
 
             # Save the new JSON file
-            with open(json_file, 'w') as file:
-                json.dump(new_data, file, indent=4)
+            write_json_file(json_file, new_data)
 
-            self.feedback_area.append(f"New JSON file created:\n {json_file}\n")
-            # Push to github
-            REPO_DIR = os.path.dirname(os.path.abspath(__file__))
-            push_to_github(REPO_DIR, "Added process message")
+            self.feedback_area.appendPlainText(f"New JSON file created:\n {json_file}\n")
+            # Push to github once the scanning session is over
+            self._push_pending = True
+            return new_data
 
         except Exception as e:
-            self.feedback_area.append(f"Error creating new JSON file:\n {e}\n")
+            self.feedback_area.appendPlainText(f"Error creating new JSON file:\n {e}\n")
+            return None
+
+    def done(self, result):
+        """Push the report files created while scanning in one commit when the dialog closes."""
+        if self._push_pending:
+            self._push_pending = False
+            # Hand the push to the main window so it runs in the background, after any git work already in progress
+            if self._push:
+                self._push("Added process message")
+            else:
+                push_to_github(MODULE_DIR, "Added process message")
+        super().done(result)
 
 
 if __name__ == "__main__":
     current_directory = os.getcwd()
-    check_for_updates(current_directory)
-    parent_directory = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    parent_directory = os.path.dirname(MODULE_DIR)
     app = QApplication(sys.argv)
     ex = TestLauncher(parent_directory)
+
+    # Check for updates in the background so the window does not wait on the network
+    ex.start_update_check(current_directory)
     sys.exit(app.exec_())
\ No newline at end of file